@@ -2,7 +2,7 @@
  * Tests for mcp-resonance
  */
 
-import { describe, it, expect, beforeEach } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import { ResonanceEngine } from '../resonanceEngine.js';
 import type { EcosystemMoment } from '../types.js';
 
@@ -36,6 +36,27 @@ describe('ResonanceEngine', () => {
       expect(state.observations.length).toBeGreaterThan(0);
     });
 
+    it('should accept a frozen concepts array', () => {
+      const concepts = Object.freeze(['emergence', 'pattern']);
+
+      expect(() =>
+        engine.addObservation({
+          id: 'test-1',
+          timestamp: Date.now(),
+          source: 'creative',
+          type: 'meditation',
+          concepts: concepts as string[],
+          novelty: 0.8,
+          relevance: undefined,
+          metadata: undefined,
+        })
+      ).not.toThrow();
+      const state = engine.getEcosystemState();
+      expect(state.dominantConcepts).toEqual(concepts);
+      expect(state.observations[0]?.concepts).toEqual(concepts);
+      expect(state.observations[0]?.concepts).not.toBe(concepts);
+    });
+
     it('should detect patterns across multiple observations', () => {
       const now = Date.now();
 
@@ -57,6 +78,27 @@ describe('ResonanceEngine', () => {
       expect(state.patterns.length).toBeGreaterThan(0);
     });
 
+    it('should create patterns in order of first appearance', () => {
+      const now = Date.now();
+      const concepts = [['b'], ['a'], ['a', 'b']];
+
+      concepts.forEach((c, i) => {
+        engine.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 1000,
+          source: 'creative',
+          type: 'meditation',
+          concepts: c,
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      });
+
+      const ids = engine.getEcosystemState().patterns.map((p) => p.id);
+      expect(ids).toEqual(['pattern-b', 'pattern-a']);
+    });
+
     it('should track coupling between different sources', () => {
       const now = Date.now();
 
@@ -99,9 +141,143 @@ describe('ResonanceEngine', () => {
       const state = engine.getEcosystemState();
       expect(state.couplings.length).toBeGreaterThan(0);
     });
+
+    it('should strengthen a coupling once per sequential pair', () => {
+      const now = Date.now();
+
+      for (let i = 0; i < 3; i++) {
+        engine.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 100,
+          source: 'creative',
+          type: 'observation',
+          concepts: ['emergence'],
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      const state = engine.getEcosystemState();
+      expect(state.couplings.length).toBe(1);
+      // Created at 0.3 by the first pair, +0.1 for the second
+      expect(state.couplings[0]?.strength).toBeCloseTo(0.4);
+    });
+
+    it('should round a fractional observation limit down', () => {
+      const small = new ResonanceEngine({ maxObservations: 2.5 });
+      const now = Date.now();
+
+      for (let i = 0; i < 10; i++) {
+        small.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 100,
+          source: 'creative',
+          type: 'observation',
+          concepts: ['emergence'],
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      const ids = small.getEcosystemState().observations.map((o) => o.id);
+      expect(ids).toEqual(['test-8', 'test-9']);
+    });
+
+    it('should not couple to an evicted observation', () => {
+      const single = new ResonanceEngine({ maxObservations: 1 });
+      const now = Date.now();
+
+      for (let i = 0; i < 2; i++) {
+        single.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 100,
+          source: 'creative',
+          type: 'observation',
+          concepts: ['emergence'],
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      expect(single.getEcosystemState().couplings.length).toBe(0);
+    });
+
+    it('should keep pattern frequency within the observation window', () => {
+      const small = new ResonanceEngine({
+        maxObservations: 3,
+        patternMinFrequency: 2,
+      });
+      const now = Date.now();
+
+      for (let i = 0; i < 5; i++) {
+        small.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 1000,
+          source: 'creative',
+          type: 'meditation',
+          concepts: ['emergence'],
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      const pattern = small
+        .getEcosystemState()
+        .patterns.find((p) => p.id === 'pattern-emergence');
+      expect(pattern?.frequency).toBe(3);
+      expect(pattern?.occurrences.map((o) => o.id)).toEqual([
+        'test-2',
+        'test-3',
+        'test-4',
+      ]);
+    });
+
+    it('should refresh a pattern that recurs after falling below threshold', () => {
+      const small = new ResonanceEngine({
+        maxObservations: 3,
+        patternMinFrequency: 2,
+      });
+      const now = Date.now();
+      const concepts = [
+        ['x', 'y'],
+        ['x', 'y'],
+        ['z'],
+        ['z'],
+        ['z'],
+        ['x', 'z'],
+      ];
+
+      concepts.forEach((c, i) => {
+        small.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 1000,
+          source: 'creative',
+          type: 'meditation',
+          concepts: c,
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      });
+
+      const patterns = small.getEcosystemState().patterns;
+      const x = patterns.find((p) => p.id === 'pattern-x');
+      expect(x?.frequency).toBe(1);
+      expect(x?.occurrences.length).toBe(1);
+      expect(x?.strength).toBeLessThan(0.5);
+      for (const p of patterns) expect(Number.isFinite(p.strength)).toBe(true);
+    });
   });
 
   describe('getEcosystemState', () => {
+    afterEach(() => {
+      vi.useRealTimers();
+    });
+
     it('should return initial empty state', () => {
       const state = engine.getEcosystemState();
 
@@ -134,6 +310,26 @@ describe('ResonanceEngine', () => {
       expect(state.totalCoherence).toBeLessThanOrEqual(1);
     });
 
+    it('should report coherence from novelty without rounding', () => {
+      const quiet = new ResonanceEngine({ enableAutoAmplification: false });
+      const now = Date.now();
+
+      for (let i = 0; i < 2; i++) {
+        quiet.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 100,
+          source: 'creative',
+          type: 'meditation',
+          concepts: ['harmony'],
+          novelty: 0.7,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      expect(quiet.getEcosystemState().totalCoherence).toBe(0.7 * (2 / 3));
+    });
+
     it('should extract dominant concepts', () => {
       const now = Date.now();
 
@@ -162,6 +358,145 @@ describe('ResonanceEngine', () => {
       const state = engine.getEcosystemState();
       expect(state.dominantConcepts.includes('harmony')).toBe(true);
     });
+
+    it('should name dominant concepts correctly as concepts come and go', () => {
+      const small = new ResonanceEngine({ maxObservations: 2 });
+      const now = Date.now();
+
+      for (let i = 0; i < 50; i++) {
+        small.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 100,
+          source: 'creative',
+          type: 'observation',
+          concepts: [`concept-${i}`],
+          novelty: 0.5 + i * 0.01,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      expect(small.getEcosystemState().dominantConcepts).toEqual([
+        'concept-49',
+        'concept-48',
+      ]);
+    });
+
+    it('should reuse the snapshot until a new observation arrives', () => {
+      const moment: EcosystemMoment = {
+        id: 'test-1',
+        timestamp: Date.now(),
+        source: 'creative',
+        type: 'meditation',
+        concepts: ['harmony'],
+        novelty: 0.8,
+        relevance: undefined,
+        metadata: undefined,
+      };
+
+      engine.addObservation(moment);
+      const first = engine.getEcosystemState();
+      expect(engine.getEcosystemState()).toBe(first);
+
+      engine.addObservation({ ...moment, id: 'test-2' });
+      const second = engine.getEcosystemState();
+      expect(second).not.toBe(first);
+      expect(second.observations.length).toBe(2);
+    });
+
+    it('should keep a held snapshot fixed as observations arrive', () => {
+      const now = Date.now();
+      const moment: EcosystemMoment = {
+        id: 'test-0',
+        timestamp: now,
+        source: 'creative',
+        type: 'meditation',
+        concepts: ['harmony'],
+        novelty: 0.8,
+        relevance: undefined,
+        metadata: undefined,
+      };
+
+      engine.addObservation(moment);
+      engine.addObservation({ ...moment, id: 'test-1', timestamp: now + 10 });
+      const held = engine.getEcosystemState();
+      held.patterns[0]?.occurrences.splice(0);
+
+      engine.addObservation({ ...moment, id: 'test-2', timestamp: now + 20 });
+      expect(held.patterns[0]?.frequency).toBe(2);
+      expect(held.couplings[0]?.strength).toBeCloseTo(0.3);
+
+      const pattern = engine.getEcosystemState().patterns[0];
+      expect(pattern?.occurrences.map((o) => o.id)).toEqual([
+        'test-0',
+        'test-1',
+        'test-2',
+      ]);
+    });
+
+    it('should stamp a reused snapshot with its computation time', () => {
+      vi.useFakeTimers();
+      vi.setSystemTime(1_000_000);
+      engine.addObservation({
+        id: 'test-1',
+        timestamp: 400_000,
+        source: 'creative',
+        type: 'meditation',
+        concepts: ['harmony'],
+        novelty: 0.8,
+        relevance: undefined,
+        metadata: undefined,
+      });
+
+      const first = engine.getEcosystemState();
+      expect(first.observedAt).toBe(1_000_000);
+
+      vi.setSystemTime(1_000_005);
+      expect(engine.getEcosystemState().observedAt).toBe(1_000_000);
+    });
+
+    it('should drop observations that age out of a cached snapshot', () => {
+      vi.useFakeTimers();
+      vi.setSystemTime(1_000_000);
+      const shortWindow = new ResonanceEngine({ coherenceWindow: 20 });
+      shortWindow.addObservation({
+        id: 'test-1',
+        timestamp: 1_000_000,
+        source: 'creative',
+        type: 'meditation',
+        concepts: ['harmony'],
+        novelty: 0.8,
+        relevance: undefined,
+        metadata: undefined,
+      });
+
+      expect(shortWindow.getEcosystemState().observations.length).toBe(1);
+      vi.setSystemTime(1_000_019);
+      expect(shortWindow.getEcosystemState().observations.length).toBe(1);
+      vi.setSystemTime(1_000_020);
+      expect(shortWindow.getEcosystemState().observations.length).toBe(0);
+    });
+
+    it('should window observations that arrive out of order', () => {
+      const now = Date.now();
+      const base: EcosystemMoment = {
+        id: 'test-1',
+        timestamp: now,
+        source: 'creative',
+        type: 'meditation',
+        concepts: ['harmony'],
+        novelty: 0.8,
+        relevance: undefined,
+        metadata: undefined,
+      };
+
+      engine.addObservation(base);
+      engine.addObservation({ ...base, id: 'stale', timestamp: now - 600000 });
+      engine.addObservation({ ...base, id: 'test-2', timestamp: now + 10 });
+
+      const ids = engine.getEcosystemState().observations.map((o) => o.id);
+      expect(ids).toEqual(['test-1', 'test-2']);
+    });
   });
 
   describe('suggestNextSynthesis', () => {
@@ -218,6 +553,27 @@ describe('ResonanceEngine', () => {
         expect(suggestion.confidence).toBeLessThanOrEqual(1);
       }
     });
+
+    it('should reuse the suggestion while the state is unchanged', () => {
+      const now = Date.now();
+
+      for (let i = 0; i < 3; i++) {
+        engine.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 1000,
+          source: 'creative',
+          type: 'meditation',
+          concepts: ['emergence', 'flow'],
+          novelty: 0.8,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      const first = engine.suggestNextSynthesis();
+      expect(first).not.toBeNull();
+      expect(engine.suggestNextSynthesis()).toBe(first);
+    });
   });
 
   describe('visualizeCoupling', () => {
@@ -308,5 +664,29 @@ describe('ResonanceEngine', () => {
       expect(avgStrength).toBeGreaterThanOrEqual(0);
       expect(avgStrength).toBeLessThanOrEqual(1);
     });
+
+    it('should not ratchet the strength of a dormant pattern', () => {
+      const large = new ResonanceEngine({ maxObservations: 1000 });
+      const now = Date.now();
+
+      for (let i = 0; i < 202; i++) {
+        large.addObservation({
+          id: `test-${i}`,
+          timestamp: now + i * 10,
+          source: 'creative',
+          type: 'meditation',
+          concepts: i < 2 ? ['emergence', 'stale'] : ['emergence'],
+          novelty: 0.5,
+          relevance: undefined,
+          metadata: undefined,
+        });
+      }
+
+      const stale = large
+        .getEcosystemState()
+        .patterns.find((p) => p.id === 'pattern-stale');
+      expect(stale?.frequency).toBe(2);
+      expect(stale?.strength).toBeCloseTo(0.7);
+    });
   });
 });
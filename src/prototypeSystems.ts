@@ -31,8 +31,11 @@ export class ResonantCouplingNetwork {
 
     if (!couplings) return responses;
 
+    // The signal is the same for every coupling, so serialize it once
+    const signalComplexity = JSON.stringify(signal ?? {}).length;
+
     for (const [coupledServer, strength] of couplings) {
-      const response = this.calculateResonance(signal, strength);
+      const response = this.calculateResonance(signalComplexity, strength);
       responses.set(coupledServer, response);
       this.updateHarmony(coupledServer, response);
     }
@@ -56,8 +59,7 @@ export class ResonantCouplingNetwork {
     };
   }
 
-  private calculateResonance(signal: ResonanceSignal, couplingStrength: number): number {
-    const signalComplexity = JSON.stringify(signal ?? {}).length;
+  private calculateResonance(signalComplexity: number, couplingStrength: number): number {
     const baseResonance = Math.sin(signalComplexity * 0.01) * couplingStrength;
     return this.clamp(baseResonance + 0.5);
   }
@@ -13,16 +13,176 @@ import {
   HarmonicFeedback,
 } from './types.js';
 
+/**
+ * Retained occurrences of one concept
+ * Entries before each head have been evicted; they are dropped in bulk once
+ * they make up half the array, so eviction from the front is amortized O(1).
+ */
+interface ConceptOccurrences {
+  moments: EcosystemMoment[]; // in insertion order
+  sequences: number[]; // ingestion number of each moment, shares its head
+  momentsHead: number;
+  timestamps: number[]; // sorted ascending
+  timestampsHead: number;
+}
+
+/**
+ * Drop the evicted prefix of a concept's arrays once it is half of them
+ */
+function compactOccurrences(entry: ConceptOccurrences): void {
+  if (entry.momentsHead * 2 >= entry.moments.length) {
+    entry.moments.splice(0, entry.momentsHead);
+    entry.sequences.splice(0, entry.momentsHead);
+    entry.momentsHead = 0;
+  }
+  if (entry.timestampsHead * 2 >= entry.timestamps.length) {
+    entry.timestamps.splice(0, entry.timestampsHead);
+    entry.timestampsHead = 0;
+  }
+}
+
+/**
+ * Index of the first element in a sorted array that is >= value
+ */
+function lowerBound(sorted: number[], value: number, from = 0): number {
+  let lo = from;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid]! < value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/**
+ * Index of the first element in a sorted array that is > value
+ */
+function upperBound(sorted: number[], value: number, from = 0): number {
+  let lo = from;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid]! <= value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/**
+ * Count timestamps in ts1 that have a neighbour in ts2 closer than window
+ * Both arrays must be sorted ascending from their start offsets, which lets
+ * a single two-pointer sweep replace a search per element:
+ * O(|ts1| + |ts2|). Kept as a small monomorphic module-level function so V8
+ * can optimize the numeric loop.
+ */
+function countCoOccurrences(
+  ts1: number[],
+  from1: number,
+  ts2: number[],
+  from2: number,
+  window: number
+): number {
+  let count = 0;
+  let j = from2;
+  for (let i = from1; i < ts1.length; i++) {
+    const t1 = ts1[i]!;
+    // Skip everything in ts2 that is too old to match t1 or any later t1
+    while (j < ts2.length && ts2[j]! <= t1 - window) j++;
+    if (j < ts2.length && ts2[j]! - t1 < window) count++;
+  }
+  return count;
+}
+
+// Patterns whose occurrences fall within this window resonate together
+const HARMONIC_WINDOW_MS = 30000;
+
+// Initial slot count of the observation columns before they grow
+const INITIAL_COLUMN_CAPACITY = 64;
+
+// Only the most recent harmonics are retained
+const MAX_HARMONICS = 100;
+
+// Moment types that call for a critique when they make up recent activity
+const MEDITATIVE_TYPES: ReadonlySet<EcosystemMoment['type']> = new Set([
+  'meditation',
+  'insight',
+]);
+
+// Moment type that naturally follows each type in the creative cycle
+const FOLLOW_UP_TYPES: ReadonlyMap<
+  EcosystemMoment['type'],
+  EcosystemMoment['type']
+> = new Map([
+  ['meditation', 'insight'],
+  ['insight', 'critique'],
+  ['critique', 'meditation'],
+]);
+
 export class ResonanceEngine {
+  // Ring buffer of the most recent maxObservations moments: the oldest is at
+  // slot obsHead and obsCount slots are in use
   private observations: EcosystemMoment[] = [];
-  private patterns: Map<string, DetectedPattern> = new Map();
+  private obsHead = 0;
+  private obsCount = 0;
+  // Patterns in creation order, with their dense index by id and the
+  // concept occurrences backing each one
+  private patterns: DetectedPattern[] = [];
+  private patternIndex: Map<string, number> = new Map();
+  private patternOccurrences: ConceptOccurrences[] = [];
   private couplings: Map<string, Coupling> = new Map();
   private config: Required<ResonanceConfig>;
+  // Ring buffer of recent harmonics; harmonicsNext is the slot to overwrite
   private harmonics: HarmonicFeedback[] = [];
+  private harmonicsNext = 0;
+  // Moments and sorted timestamps per concept, maintained incrementally;
+  // the timestamps serve harmonic window lookups
+  private conceptIndex: Map<string, ConceptOccurrences> = new Map();
+  // Number of moments ingested so far, used to order concepts by age
+  private ingested = 0;
+  // Membership sets backing each coupling's sharedConcepts list
+  private couplingConcepts: Map<string, Set<string>> = new Map();
+  // Column storage for the fields scanned by getEcosystemState, indexed by
+  // the same ring slots as `observations`. Columns start small and double
+  // up to maxObservations while the ring fills.
+  private obsTimestamps = new Float64Array(INITIAL_COLUMN_CAPACITY);
+  private obsNovelty = new Float64Array(INITIAL_COLUMN_CAPACITY);
+  private obsConceptIds: Uint32Array[] = [];
+  // Registry mapping each concept to a dense integer id and back; ids of
+  // concepts that leave the index are recycled through freeConceptIds
+  private conceptIds: Map<string, number> = new Map();
+  private conceptNames: string[] = [];
+  private freeConceptIds: number[] = [];
+  // 32-bit concept signature of the latest moment (bit = id mod 32); two
+  // moments can only share concepts if their signatures intersect
+  private lastConceptMask = 0;
+  // Scratch buffers indexed by concept id, kept zeroed between snapshots so
+  // scoring costs O(recent window) rather than O(every concept ever seen)
+  private scoreScratch = new Float64Array(64);
+  private seenScratch = new Uint8Array(64);
+  // Adjacent observation pairs whose timestamps go backwards; while zero the
+  // timestamp column is sorted and the recent window can be binary searched
+  private obsInversions = 0;
+  // Bumped on every mutation; cached results are only valid for the
+  // generation they were computed in
+  private generation = 0;
+  // Last computed state, valid for its generation until a time-windowed
+  // filter would drop something (expiresAt)
+  private cachedState:
+    | { generation: number; state: EcosystemState; expiresAt: number }
+    | undefined;
+  // Last suggestion, valid for the state snapshot it was derived from
+  private cachedSuggestion:
+    | { state: EcosystemState; suggestion: SynthesisSuggestion | null }
+    | undefined;
 
   constructor(config: ResonanceConfig = {}) {
+    // The ring needs a whole, positive slot count
+    const maxObservations = Math.floor(config.maxObservations ?? 1000);
     this.config = {
-      maxObservations: config.maxObservations ?? 1000,
+      maxObservations: Number.isNaN(maxObservations)
+        ? 1000
+        : Math.max(1, maxObservations),
       patternMinFrequency: config.patternMinFrequency ?? 2,
       couplingThreshold: config.couplingThreshold ?? 0.3,
       coherenceWindow: config.coherenceWindow ?? 300000, // 5 minutes
@@ -34,118 +194,302 @@ export class ResonanceEngine {
    * Record a moment from the ecosystem
    */
   addObservation(moment: EcosystemMoment): void {
-    this.observations.push(moment);
-
-    // Keep only recent observations
-    if (this.observations.length > this.config.maxObservations) {
-      this.observations = this.observations.slice(-this.config.maxObservations);
+    this.generation++;
+    const capacity = this.config.maxObservations;
+
+    // Keep only recent observations: a full ring gives up its oldest slot
+    if (this.obsCount === capacity) {
+      const evicted = this.observationAt(0);
+      this.obsHead = (this.obsHead + 1) % capacity;
+      this.obsCount--;
+      const oldest = this.obsCount > 0 ? this.observationAt(0) : undefined;
+      if (oldest && oldest.timestamp < evicted.timestamp) this.obsInversions--;
+      this.evictFromIndex(evicted);
     }
 
-    // Trigger pattern detection
-    this.detectPatterns();
-
-    // Trigger coupling analysis
-    this.analyzeCouplings();
+    // Map concepts to ids and build the stored moment from the registry's
+    // canonical strings, so retained moments share one instance per concept.
+    // The caller's moment and concepts array are left untouched.
+    const ids = new Uint32Array(moment.concepts.length);
+    const concepts: string[] = [];
+    let conceptMask = 0;
+    for (let i = 0; i < moment.concepts.length; i++) {
+      const id = this.registerConcept(moment.concepts[i]!);
+      ids[i] = id;
+      concepts.push(this.conceptNames[id]!);
+      conceptMask |= 1 << (id & 31);
+    }
+    const stored: EcosystemMoment = { ...moment, concepts };
+
+    // Read after eviction, so only a retained moment can couple to this one
+    const prev =
+      this.obsCount > 0 ? this.observationAt(this.obsCount - 1) : undefined;
+    if (prev && moment.timestamp < prev.timestamp) this.obsInversions++;
+
+    const slot = (this.obsHead + this.obsCount) % capacity;
+    if (slot >= this.obsTimestamps.length) this.growColumns();
+    this.observations[slot] = stored;
+    this.obsCount++;
+    this.obsTimestamps[slot] = moment.timestamp;
+    this.obsNovelty[slot] = moment.novelty ?? 0.5;
+    this.obsConceptIds[slot] = ids;
+
+    const prevMask = this.lastConceptMask;
+    this.lastConceptMask = conceptMask;
+
+    const conceptSet = new Set(concepts);
+
+    // Trigger pattern detection for the concepts this moment carries
+    const touched = this.detectPatterns(stored, conceptSet);
+    this.ingested++;
+
+    // Only the (previous, new) pair can form a new coupling; disjoint
+    // signatures rule out shared concepts without comparing strings
+    if (prev && (conceptMask & prevMask) !== 0) {
+      this.updateCoupling(prev, stored, conceptSet);
+    }
 
     // Check for harmonic feedback
     if (this.config.enableAutoAmplification) {
-      this.detectHarmonic();
+      this.detectHarmonic(touched);
     }
   }
 
   /**
-   * Detect patterns across observations
-   * A pattern is a recurring set of concepts or temporal sequences
+   * Double the observation columns, capped at maxObservations
+   * Only called while the ring is still filling, so obsHead is 0 and the
+   * used slots are a prefix that can be copied as-is.
    */
-  private detectPatterns(): void {
-    const conceptFrequency = new Map<string, EcosystemMoment[]>();
-
-    // Count occurrences of each concept
-    for (const obs of this.observations) {
-      for (const concept of obs.concepts) {
-        if (!conceptFrequency.has(concept)) {
-          conceptFrequency.set(concept, []);
-        }
-        conceptFrequency.get(concept)!.push(obs);
-      }
+  private growColumns(): void {
+    const size = Math.min(
+      this.config.maxObservations,
+      this.obsTimestamps.length * 2
+    );
+    const timestamps = new Float64Array(size);
+    timestamps.set(this.obsTimestamps);
+    this.obsTimestamps = timestamps;
+    const novelty = new Float64Array(size);
+    novelty.set(this.obsNovelty);
+    this.obsNovelty = novelty;
+  }
+
+  /**
+   * Observation at a logical position, 0 being the oldest retained
+   */
+  private observationAt(index: number): EcosystemMoment {
+    return this.observations[
+      (this.obsHead + index) % this.config.maxObservations
+    ]!;
+  }
+
+  /**
+   * Get the dense id for a concept, assigning one on first sight
+   */
+  private registerConcept(concept: string): number {
+    let id = this.conceptIds.get(concept);
+    if (id === undefined) {
+      id = this.freeConceptIds.pop() ?? this.conceptNames.length;
+      this.conceptIds.set(concept, id);
+      this.conceptNames[id] = concept;
     }
+    return id;
+  }
+
+  /**
+   * Return a concept's id to the free list once no retained moment has it
+   */
+  private releaseConcept(concept: string): void {
+    const id = this.conceptIds.get(concept);
+    if (id === undefined) return;
+    this.conceptIds.delete(concept);
+    this.freeConceptIds.push(id);
+  }
 
-    // Create patterns for concepts that appear frequently
-    for (const [concept, moments] of conceptFrequency.entries()) {
-      if (moments.length >= this.config.patternMinFrequency) {
-        // Stable id per concept so the pattern strengthens over time
-        const patternId = `pattern-${concept}`;
-        const strength = Math.min(
-          1,
-          moments.length / (this.config.patternMinFrequency + 1)
+  /**
+   * Drop an evicted moment from the concept index
+   * Evicted moments are always the oldest, so they sit at the front
+   */
+  private evictFromIndex(moment: EcosystemMoment): void {
+    for (const concept of moment.concepts) {
+      const entry = this.conceptIndex.get(concept);
+      if (!entry) continue;
+      entry.momentsHead++;
+
+      // In-order input evicts from the front; otherwise search for it
+      const timestamps = entry.timestamps;
+      if (timestamps[entry.timestampsHead] === moment.timestamp) {
+        entry.timestampsHead++;
+      } else {
+        const idx = lowerBound(
+          timestamps,
+          moment.timestamp,
+          entry.timestampsHead
         );
+        if (timestamps[idx] === moment.timestamp) timestamps.splice(idx, 1);
+      }
+      compactOccurrences(entry);
+
+      const frequency = entry.moments.length - entry.momentsHead;
+      const index = this.patternIndex.get(`pattern-${concept}`);
+      const pattern = index === undefined ? undefined : this.patterns[index];
+      if (pattern) {
+        pattern.frequency = frequency;
+        pattern.strength = this.baseStrength(frequency);
+      }
 
-        if (!this.patterns.has(patternId)) {
-          const pattern: DetectedPattern = {
-            id: patternId,
-            name: `${concept} Resonance`,
-            concepts: [concept],
-            occurrences: moments,
-            frequency: moments.length,
-            strength,
-            emergenceTime: moments[0]?.timestamp ?? Date.now(),
-            relatedPatterns: [],
-          };
+      if (frequency === 0 && !pattern) {
+        this.conceptIndex.delete(concept);
+        this.releaseConcept(concept);
+      }
+    }
+  }
 
-          this.patterns.set(patternId, pattern);
-        } else {
-          const existing = this.patterns.get(patternId)!;
-          existing.occurrences = moments;
-          existing.frequency = moments.length;
-          existing.strength = strength;
-        }
+  /**
+   * Detect patterns across observations
+   * A pattern is a recurring set of concepts or temporal sequences.
+   * Only the concepts of the new moment can change, so only those are visited.
+   * Returns the indices of patterns the moment belongs to.
+   */
+  private detectPatterns(
+    moment: EcosystemMoment,
+    conceptSet: Set<string>
+  ): Set<number> {
+    for (const concept of moment.concepts) {
+      let entry = this.conceptIndex.get(concept);
+      if (!entry) {
+        entry = {
+          moments: [],
+          sequences: [],
+          momentsHead: 0,
+          timestamps: [],
+          timestampsHead: 0,
+        };
+        this.conceptIndex.set(concept, entry);
+      }
+      entry.moments.push(moment);
+      entry.sequences.push(this.ingested);
+
+      // In-order input appends; only late arrivals need a sorted insert.
+      // A fully evicted list has been compacted, so its last entry is live.
+      const timestamps = entry.timestamps;
+      const latest = timestamps[timestamps.length - 1];
+      if (latest === undefined || latest <= moment.timestamp) {
+        timestamps.push(moment.timestamp);
+      } else {
+        timestamps.splice(
+          upperBound(timestamps, moment.timestamp, entry.timestampsHead),
+          0,
+          moment.timestamp
+        );
+      }
+    }
+
+    const touched = new Set<number>();
+    const emerging: string[] = [];
+
+    // Refresh existing patterns, even if eviction left them below threshold
+    for (const concept of conceptSet) {
+      const entry = this.conceptIndex.get(concept)!;
+      const frequency = entry.moments.length - entry.momentsHead;
+
+      // Stable id per concept so the pattern strengthens over time
+      const index = this.patternIndex.get(`pattern-${concept}`);
+      const existing = index === undefined ? undefined : this.patterns[index];
+      if (existing) {
+        existing.frequency = frequency;
+        existing.strength = this.baseStrength(frequency);
+        touched.add(index!);
+      } else if (frequency >= this.config.patternMinFrequency) {
+        emerging.push(concept);
       }
     }
+
+    // Create patterns for concepts that now appear frequently, oldest
+    // concept first: by first retained occurrence, then position within it
+    if (emerging.length > 1) {
+      emerging.sort((x, y) => {
+        const ex = this.conceptIndex.get(x)!;
+        const ey = this.conceptIndex.get(y)!;
+        const order =
+          ex.sequences[ex.momentsHead]! - ey.sequences[ey.momentsHead]!;
+        if (order !== 0) return order;
+        const first = ex.moments[ex.momentsHead]!.concepts;
+        return first.indexOf(x) - first.indexOf(y);
+      });
+    }
+    for (const concept of emerging) {
+      const entry = this.conceptIndex.get(concept)!;
+      const frequency = entry.moments.length - entry.momentsHead;
+      const pattern: DetectedPattern = {
+        id: `pattern-${concept}`,
+        name: `${concept} Resonance`,
+        concepts: [concept],
+        // Filled in from the concept index when a snapshot is taken
+        occurrences: [],
+        frequency,
+        strength: this.baseStrength(frequency),
+        emergenceTime: entry.moments[entry.momentsHead]!.timestamp,
+        relatedPatterns: [],
+      };
+
+      const index = this.patterns.length;
+      this.patterns.push(pattern);
+      this.patternIndex.set(pattern.id, index);
+      this.patternOccurrences.push(entry);
+      touched.add(index);
+    }
+
+    return touched;
+  }
+
+  /**
+   * Pattern strength implied by frequency alone, before harmonic feedback
+   */
+  private baseStrength(frequency: number): number {
+    return Math.min(1, frequency / (this.config.patternMinFrequency + 1));
   }
 
   /**
-   * Analyze how MCPs/concepts are coupled together
+   * Update the coupling formed between two sequential moments
    */
-  private analyzeCouplings(): void {
-    // Look at sequential moments to find couplings
-    for (let i = 0; i < this.observations.length - 1; i++) {
-      const curr = this.observations[i];
-      const next = this.observations[i + 1];
+  private updateCoupling(
+    curr: EcosystemMoment,
+    next: EcosystemMoment,
+    nextConcepts: Set<string>
+  ): void {
+    // Find shared concepts
+    const sharedConcepts = curr.concepts.filter((c) => nextConcepts.has(c));
 
-      if (!curr || !next) continue;
+    if (sharedConcepts.length === 0) return;
 
-      // Find shared concepts
-      const sharedConcepts = curr.concepts.filter((c) =>
-        next.concepts.includes(c)
-      );
+    const couplingId = `${curr.source}->${next.source}`;
+    const timeDelta = next.timestamp - curr.timestamp;
+    const isRecent = timeDelta < 60000; // within 1 minute
 
-      if (sharedConcepts.length > 0) {
-        const couplingId = `${curr.source}->${next.source}`;
-        const timeDelta = next.timestamp - curr.timestamp;
-        const isRecent = timeDelta < 60000; // within 1 minute
-
-        if (this.couplings.has(couplingId)) {
-          const coupling = this.couplings.get(couplingId)!;
-          coupling.strength = Math.min(
-            1,
-            coupling.strength + 0.1 * (isRecent ? 1 : 0.5)
-          );
-          coupling.sharedConcepts = Array.from(
-            new Set([...coupling.sharedConcepts, ...sharedConcepts])
-          );
-          coupling.lastActive = next.timestamp;
-        } else {
-          const coupling: Coupling = {
-            sourceId: curr.source,
-            targetId: next.source,
-            strength: 0.3,
-            type: this.inferCouplingType(curr, next),
-            sharedConcepts,
-            lastActive: next.timestamp,
-          };
-          this.couplings.set(couplingId, coupling);
-        }
+    const existing = this.couplings.get(couplingId);
+    if (existing) {
+      existing.strength = Math.min(
+        1,
+        existing.strength + 0.1 * (isRecent ? 1 : 0.5)
+      );
+      const known = this.couplingConcepts.get(couplingId)!;
+      for (const concept of sharedConcepts) {
+        if (known.has(concept)) continue;
+        known.add(concept);
+        existing.sharedConcepts.push(concept);
       }
+      existing.lastActive = next.timestamp;
+    } else {
+      const coupling: Coupling = {
+        sourceId: curr.source,
+        targetId: next.source,
+        strength: 0.3,
+        type: this.inferCouplingType(curr, next),
+        sharedConcepts: Array.from(new Set(sharedConcepts)),
+        lastActive: next.timestamp,
+      };
+      this.couplings.set(couplingId, coupling);
+      this.couplingConcepts.set(couplingId, new Set(sharedConcepts));
     }
   }
 
@@ -156,12 +500,7 @@ export class ResonanceEngine {
     curr: EcosystemMoment,
     next: EcosystemMoment
   ): Coupling['type'] {
-    const isFollowUp =
-      (curr.type === 'meditation' && next.type === 'insight') ||
-      (curr.type === 'insight' && next.type === 'critique') ||
-      (curr.type === 'critique' && next.type === 'meditation');
-
-    if (isFollowUp) return 'sequential';
+    if (FOLLOW_UP_TYPES.get(curr.type) === next.type) return 'sequential';
 
     const hasSharedSource = curr.source === next.source;
     if (hasSharedSource) return 'lateral';
@@ -174,26 +513,47 @@ export class ResonanceEngine {
 
   /**
    * Detect harmonic feedback - when patterns strengthen each other
+   * Only pairs involving a pattern touched by the latest moment are revisited.
+   * Untouched partners start again from their base strength, so feedback
+   * does not accumulate on a pattern whose own frequency is not growing.
    */
-  private detectHarmonic(): void {
-    const patternArray = Array.from(this.patterns.values());
+  private detectHarmonic(touched: Set<number>): void {
+    if (touched.size === 0) return;
+
+    const patterns = this.patterns;
+    const touchedIndices = Array.from(touched).sort((x, y) => x - y);
+    const rebased = new Set<number>();
 
-    for (let i = 0; i < patternArray.length; i++) {
-      const p1 = patternArray[i];
-      if (!p1) continue;
+    for (const t of touchedIndices) {
+      for (let k = 0; k < patterns.length; k++) {
+        // Pairs of two touched patterns are visited once, from the earlier one
+        if (k === t || (k < t && touched.has(k))) continue;
 
-      for (let j = i + 1; j < patternArray.length; j++) {
-        const p2 = patternArray[j];
-        if (!p2) continue;
+        // Preserve the original pair orientation (insertion order)
+        const a = Math.min(t, k);
+        const b = Math.max(t, k);
+        const p1 = patterns[a];
+        const p2 = patterns[b];
+        if (!p1 || !p2) continue;
 
         // Check if patterns appear together frequently
-        const commonOccurrences = p1.occurrences.filter((o1) =>
-          p2.occurrences.some(
-            (o2) => Math.abs(o1.timestamp - o2.timestamp) < 30000
-          )
-        ).length;
+        const o1 = this.patternOccurrences[a]!;
+        const o2 = this.patternOccurrences[b]!;
+        const commonOccurrences = countCoOccurrences(
+          o1.timestamps,
+          o1.timestampsHead,
+          o2.timestamps,
+          o2.timestampsHead,
+          HARMONIC_WINDOW_MS
+        );
+
+        if (commonOccurrences > 0 && p1.frequency > 0) {
+          if (!touched.has(k) && !rebased.has(k)) {
+            const partner = patterns[k]!;
+            partner.strength = this.baseStrength(partner.frequency);
+            rebased.add(k);
+          }
 
-        if (commonOccurrences > 0) {
           const amplification =
             (p1.strength * p2.strength * commonOccurrences) / p1.frequency;
 
@@ -208,76 +568,162 @@ export class ResonanceEngine {
           p1.strength = Math.min(1, p1.strength + 0.05 * amplification);
           p2.strength = Math.min(1, p2.strength + 0.05 * amplification);
 
-          this.harmonics.push(feedback);
+          this.recordHarmonic(feedback);
         }
       }
     }
+  }
 
-    // Keep only recent harmonics
-    this.harmonics = this.harmonics.slice(-100);
+  /**
+   * Keep a harmonic, overwriting the oldest once the buffer is full
+   */
+  private recordHarmonic(feedback: HarmonicFeedback): void {
+    if (this.harmonics.length < MAX_HARMONICS) {
+      this.harmonics.push(feedback);
+      return;
+    }
+    this.harmonics[this.harmonicsNext] = feedback;
+    this.harmonicsNext = (this.harmonicsNext + 1) % MAX_HARMONICS;
   }
 
   /**
    * Get the current state of the ecosystem
+   * The snapshot is reused while valid, so observedAt is when it was computed.
    */
   getEcosystemState(): EcosystemState {
-    const recentWindow = Date.now() - this.config.coherenceWindow;
-    const recentObservations = this.observations.filter(
-      (o) => o.timestamp > recentWindow
-    );
+    // Reuse the last snapshot while nothing it depends on has changed
+    const now = Date.now();
+    if (
+      this.cachedState?.generation === this.generation &&
+      now < this.cachedState.expiresAt
+    ) {
+      return this.cachedState.state;
+    }
+
+    let expiresAt = Infinity;
+    const recentWindow = now - this.config.coherenceWindow;
+    const capacity = this.config.maxObservations;
+    const count = this.obsCount;
+
+    // With sorted timestamps the recent window is a suffix: skip the rest
+    let start = 0;
+    if (this.obsInversions === 0) {
+      let hi = count;
+      while (start < hi) {
+        const mid = (start + hi) >>> 1;
+        const slot = (this.obsHead + mid) % capacity;
+        if (this.obsTimestamps[slot]! > recentWindow) {
+          hi = mid;
+        } else {
+          start = mid + 1;
+        }
+      }
+    }
+
+    const recentObservations: EcosystemMoment[] = [];
+    let noveltySum = 0;
+    // Novelty-weighted concept scores, scattered by concept id
+    if (this.scoreScratch.length < this.conceptNames.length) {
+      const size = Math.max(
+        this.conceptNames.length,
+        this.scoreScratch.length * 2
+      );
+      this.scoreScratch = new Float64Array(size);
+      this.seenScratch = new Uint8Array(size);
+    }
+    const conceptScores = this.scoreScratch;
+    const seen = this.seenScratch;
+    const scoredIds: number[] = []; // in order of first appearance
+    for (let i = start; i < count; i++) {
+      const slot = (this.obsHead + i) % capacity;
+      if (this.obsTimestamps[slot]! > recentWindow) {
+        recentObservations.push(this.observations[slot]!);
+        const novelty = this.obsNovelty[slot]!;
+        noveltySum += novelty;
+        for (const id of this.obsConceptIds[slot]!) {
+          conceptScores[id] = conceptScores[id]! + novelty;
+          if (!seen[id]) {
+            seen[id] = 1;
+            scoredIds.push(id);
+          }
+        }
+        expiresAt = Math.min(
+          expiresAt,
+          this.obsTimestamps[slot]! + this.config.coherenceWindow
+        );
+      }
+    }
 
     // Calculate coherence (0 to 1)
-    const avgNovelty =
-      recentObservations.reduce((sum, o) => sum + (o.novelty ?? 0.5), 0) /
-      (recentObservations.length || 1);
+    const avgNovelty = noveltySum / (recentObservations.length || 1);
+    let strengthSum = 0;
+    for (const pattern of this.patterns) strengthSum += pattern.strength;
     const totalCoherence = Math.min(
       1,
-      avgNovelty *
-        (Array.from(this.patterns.values()).reduce(
-          (sum, p) => sum + p.strength,
-          0
-        ) /
-          (this.patterns.size || 1))
+      avgNovelty * (strengthSum / (this.patterns.length || 1))
     );
 
     // Determine if system is resonant
-    const activeCouplings = Array.from(this.couplings.values()).filter(
-      (c) => Date.now() - c.lastActive < 60000
-    );
+    // One pass over the couplings both lists them and counts the active
+    const couplings: Coupling[] = [];
+    let activeCouplings = 0;
+    for (const coupling of this.couplings.values()) {
+      couplings.push({
+        ...coupling,
+        sharedConcepts: coupling.sharedConcepts.slice(),
+      });
+      if (now - coupling.lastActive < 60000) {
+        activeCouplings++;
+        expiresAt = Math.min(expiresAt, coupling.lastActive + 60000);
+      }
+    }
     const isResonant =
-      activeCouplings.length > 0 && totalCoherence > 0.5 && this.harmonics.length > 2;
-
-    // Extract dominant concepts
-    const conceptScores = new Map<string, number>();
-    for (const obs of recentObservations) {
-      for (const concept of obs.concepts) {
-        conceptScores.set(
-          concept,
-          (conceptScores.get(concept) ?? 0) + (obs.novelty ?? 0.5)
-        );
+      activeCouplings > 0 && totalCoherence > 0.5 && this.harmonics.length > 2;
+
+    // Extract dominant concepts: top 5 by score, earlier concepts win ties
+    const top: number[] = [];
+    for (const id of scoredIds) {
+      const score = conceptScores[id]!;
+      let pos = top.length;
+      while (pos > 0 && score > conceptScores[top[pos - 1]!]!) pos--;
+      if (pos < 5) {
+        top.splice(pos, 0, id);
+        if (top.length > 5) top.pop();
       }
     }
-    const dominantConcepts = Array.from(conceptScores.entries())
-      .sort((a, b) => b[1] - a[1])
-      .slice(0, 5)
-      .map(([concept]) => concept);
+    const dominantConcepts = top.map((id) => this.conceptNames[id]!);
+    for (const id of scoredIds) {
+      conceptScores[id] = 0;
+      seen[id] = 0;
+    }
 
     // Extract emergent intentions
-    const emergentIntentions = Array.from(this.patterns.values())
-      .filter((p) => p.strength > 0.6)
-      .slice(0, 3)
-      .map((p) => p.name);
+    const emergentIntentions: string[] = [];
+    for (const pattern of this.patterns) {
+      if (emergentIntentions.length === 3) break;
+      if (pattern.strength > 0.6) emergentIntentions.push(pattern.name);
+    }
 
-    return {
+    const state: EcosystemState = {
       observations: recentObservations,
-      patterns: Array.from(this.patterns.values()),
-      couplings: Array.from(this.couplings.values()),
+      // Copies, so the snapshot stays fixed and cannot reach the live index
+      patterns: this.patterns.map((pattern, i) => {
+        const entry = this.patternOccurrences[i]!;
+        return {
+          ...pattern,
+          occurrences: entry.moments.slice(entry.momentsHead),
+        };
+      }),
+      couplings,
       totalCoherence,
       isResonant,
       dominantConcepts,
       emergentIntentions,
-      observedAt: Date.now(),
+      observedAt: now,
     };
+
+    this.cachedState = { generation: this.generation, state, expiresAt };
+    return state;
   }
 
   /**
@@ -286,20 +732,39 @@ export class ResonanceEngine {
   suggestNextSynthesis(): SynthesisSuggestion | null {
     const state = this.getEcosystemState();
 
+    // A new snapshot is built whenever anything it depends on changes
+    let cached = this.cachedSuggestion;
+    if (!cached || cached.state !== state) {
+      cached = { state, suggestion: this.deriveSynthesis(state) };
+      this.cachedSuggestion = cached;
+    }
+    return cached.suggestion;
+  }
+
+  /**
+   * Derive a synthesis suggestion from a state snapshot
+   */
+  private deriveSynthesis(state: EcosystemState): SynthesisSuggestion | null {
     if (state.emergentIntentions.length === 0) {
       return null;
     }
 
-    // Check what kind of action would amplify current patterns
-    const lastObservations = this.observations.slice(-5);
-    const lastTypes = lastObservations.map((o) => o.type);
+    // Check what kind of action would amplify current patterns,
+    // classifying the last five moments in a single pass
+    let allMeditative = true;
+    let hasCritique = false;
+    for (let i = Math.max(0, this.obsCount - 5); i < this.obsCount; i++) {
+      const type = this.observationAt(i).type;
+      if (!MEDITATIVE_TYPES.has(type)) allMeditative = false;
+      if (type === 'critique') hasCritique = true;
+    }
 
     let suggestedAction: SynthesisSuggestion['suggestedAction'] = 'observe';
 
     // Suggest based on pattern of recent actions
-    if (lastTypes.every((t) => t === 'meditation' || t === 'insight')) {
+    if (allMeditative) {
       suggestedAction = 'consult'; // Time to get critique
-    } else if (lastTypes.some((t) => t === 'critique')) {
+    } else if (hasCritique) {
       suggestedAction = 'meditate'; // Feed the critique back in
     } else if (state.isResonant) {
       suggestedAction = 'weave'; // System is ready to synthesize
@@ -319,32 +784,51 @@ export class ResonanceEngine {
    * Visualize the coupling graph as a simple text representation
    */
   visualizeCoupling(): string {
+    const now = Date.now();
     const active = Array.from(this.couplings.values())
-      .filter((c) => Date.now() - c.lastActive < 120000)
+      .filter((c) => now - c.lastActive < 120000)
       .sort((a, b) => b.strength - a.strength);
 
     if (active.length === 0) {
       return 'No active couplings detected.';
     }
 
-    let viz = 'COUPLING GRAPH:\n\n';
+    const parts = ['COUPLING GRAPH:\n\n'];
     for (const coupling of active) {
       const strength = Math.round(coupling.strength * 10);
       const bar = '█'.repeat(strength) + '░'.repeat(10 - strength);
-      viz += `${coupling.sourceId} ${bar} ${coupling.targetId}\n`;
-      viz += `  Type: ${coupling.type}, Shared: [${coupling.sharedConcepts.join(', ')}]\n\n`;
+      parts.push(
+        `${coupling.sourceId} ${bar} ${coupling.targetId}\n`,
+        `  Type: ${coupling.type}, Shared: [${coupling.sharedConcepts.join(', ')}]\n\n`
+      );
     }
 
-    return viz;
+    return parts.join('');
   }
 
   /**
    * Clear all observations and patterns
    */
   reset(): void {
+    this.generation++;
     this.observations = [];
-    this.patterns.clear();
+    this.obsHead = 0;
+    this.obsCount = 0;
+    this.obsInversions = 0;
+    this.obsConceptIds = [];
+    this.conceptIds.clear();
+    this.conceptNames = [];
+    this.freeConceptIds = [];
+    this.lastConceptMask = 0;
+    this.patterns = [];
+    this.patternIndex.clear();
+    this.patternOccurrences = [];
     this.couplings.clear();
+    this.couplingConcepts.clear();
     this.harmonics = [];
+    this.harmonicsNext = 0;
+    this.cachedSuggestion = undefined;
+    this.conceptIndex.clear();
+    this.ingested = 0;
   }
 }
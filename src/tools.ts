@@ -10,7 +10,7 @@ import {
   ResonantCouplingNetwork,
   type ResonanceSignal,
 } from './prototypeSystems.js';
-import type { EcosystemMoment } from './types.js';
+import type { EcosystemMoment, EcosystemState } from './types.js';
 
 export interface Tool {
   name: string;
@@ -33,6 +33,12 @@ const couplingNetwork = new ResonantCouplingNetwork();
 const loadBalancer = new AdaptiveLoadBalancer();
 const orchestrator = new EmergentOrchestrator();
 
+// Serialized snapshots, reused while the engine hands back the same state
+const serializedStates = new WeakMap<EcosystemState, string>();
+
+// Disambiguates moments recorded within the same millisecond
+let momentCounter = 0;
+
 export function createResonanceTools(engine: ResonanceEngine): Tool[] {
   return [
     {
@@ -233,16 +239,22 @@ export async function handleResonanceTool(
   switch (name) {
     case 'observe_ecosystem_state': {
       const state = engine.getEcosystemState();
+      let text = serializedStates.get(state);
+      if (text === undefined) {
+        text = JSON.stringify(state, null, 2);
+        serializedStates.set(state, text);
+      }
       return {
         type: 'text',
-        text: JSON.stringify(state, null, 2),
+        text,
       };
     }
 
     case 'record_ecosystem_moment': {
+      const now = Date.now();
       const moment: EcosystemMoment = {
-        id: `moment-${Date.now()}-${Math.random().toString(36).slice(2, 9)}`,
-        timestamp: Date.now(),
+        id: `moment-${now}-${momentCounter++}`,
+        timestamp: now,
         source: args.source as EcosystemMoment['source'],
         type: args.type as EcosystemMoment['type'],
         concepts: args.concepts as string[],
@@ -275,17 +287,19 @@ export async function handleResonanceTool(
         };
       }
 
-      let result = `DETECTED PATTERNS (${patterns.length}):\n\n`;
+      const parts = [`DETECTED PATTERNS (${patterns.length}):\n\n`];
       for (const pattern of patterns) {
-        result += `• ${pattern.name} [strength: ${(pattern.strength * 100).toFixed(0)}%]\n`;
-        result += `  Concepts: ${pattern.concepts.join(', ')}\n`;
-        result += `  Frequency: ${pattern.frequency} occurrences\n`;
-        result += `  Related patterns: ${pattern.relatedPatterns.join(', ') || 'none yet'}\n\n`;
+        parts.push(
+          `• ${pattern.name} [strength: ${(pattern.strength * 100).toFixed(0)}%]\n`,
+          `  Concepts: ${pattern.concepts.join(', ')}\n`,
+          `  Frequency: ${pattern.frequency} occurrences\n`,
+          `  Related patterns: ${pattern.relatedPatterns.join(', ') || 'none yet'}\n\n`
+        );
       }
 
       return {
         type: 'text',
-        text: result,
+        text: parts.join(''),
       };
     }
 
@@ -46,28 +46,35 @@ export interface Coupling {
 
 /**
  * The current state of the ecosystem as observed by resonance
+ * Snapshots are memoized and shared between callers, so they are read-only
  */
 export interface EcosystemState {
-  observations: EcosystemMoment[];
-  patterns: DetectedPattern[];
-  couplings: Coupling[];
-  totalCoherence: number; // 0 to 1
-  isResonant: boolean; // is the system in a state of harmony?
-  dominantConcepts: string[];
-  emergentIntentions: string[];
-  observedAt: number;
+  readonly observations: readonly EcosystemMoment[];
+  readonly patterns: readonly DetectedPattern[];
+  readonly couplings: readonly Coupling[];
+  readonly totalCoherence: number; // 0 to 1
+  readonly isResonant: boolean; // is the system in a state of harmony?
+  readonly dominantConcepts: readonly string[];
+  readonly emergentIntentions: readonly string[];
+  readonly observedAt: number; // when the snapshot was computed
 }
 
 /**
  * A suggested synthesis - where the system wants to go next
+ * Suggestions are cached per state snapshot, so they are read-only
  */
 export interface SynthesisSuggestion {
-  id: string;
-  reason: string;
-  targetConcepts: string[];
-  suggestedAction: 'meditate' | 'consult' | 'weave' | 'observe' | 'rest';
-  confidence: number;
-  basedOnPatterns: string[];
+  readonly id: string;
+  readonly reason: string;
+  readonly targetConcepts: readonly string[];
+  readonly suggestedAction:
+    | 'meditate'
+    | 'consult'
+    | 'weave'
+    | 'observe'
+    | 'rest';
+  readonly confidence: number;
+  readonly basedOnPatterns: readonly string[];
 }
 
 /**